@@ -61,17 +61,16 @@ setup(
     },
 )
 """
-from collections import namedtuple
-from setuptools.command.build_py import build_py
-from setuptools.command.sdist import sdist
-from fnmatch import fnmatchcase
+from collections import deque
+from fnmatch import translate
+from functools import lru_cache
 from logging import getLogger
-from os import curdir, getenv, listdir, remove, sep
-from os.path import abspath, dirname, expanduser, isdir, isfile, join
+from os import O_RDONLY, close, curdir, getenv, open as os_open, read, replace, scandir, sep
+from os.path import abspath, dirname, exists, expanduser, isdir, isfile, ismount, join
 from re import compile
-from subprocess import CalledProcessError, PIPE, Popen
+from subprocess import CalledProcessError, run
+import sys
 
-from .compat import shlex_split_unicode
 from ..deprecations import deprecated
 
 deprecated.module(
@@ -85,73 +84,134 @@ deprecated.module(
 
 log = getLogger(__name__)
 
-Response = namedtuple('Response', ['stdout', 'stderr', 'rc'])
-GIT_DESCRIBE_REGEX = compile(r"(?:[_-a-zA-Z]*)"
-                             r"(?P<version>[a-zA-Z0-9.]+)"
-                             r"(?:-(?P<post>\d+)-g(?P<hash>[0-9a-f]{7,}))$")
-
 
 def call(command, path=None, raise_on_error=True):
     path = sys.prefix if path is None else abspath(path)
-    p = Popen(shlex_split_unicode(command), cwd=path, stdout=PIPE, stderr=PIPE)
-    stdout, stderr = p.communicate()
-    rc = p.returncode
+    p = run(command, cwd=path, capture_output=True, check=False)
+    stdout, stderr, rc = p.stdout, p.stderr, p.returncode
+    # %-style args keep the formatting lazy; the string is only built when
+    # DEBUG logging is actually enabled
     log.debug(
-        "{} $  {}\n"
-        "  stdout: {}\n"
-        "  stderr: {}\n"
-        "  rc: {}".format(path, command, stdout, stderr, rc)
+        "%s $  %s\n"
+        "  stdout: %s\n"
+        "  stderr: %s\n"
+        "  rc: %s",
+        path, command, stdout, stderr, rc,
     )
     if raise_on_error and rc != 0:
         raise CalledProcessError(rc, command, f"stdout: {stdout}\nstderr: {stderr}")
-    return Response(stdout.decode('utf-8'), stderr.decode('utf-8'), int(rc))
+    return stdout.decode('utf-8'), stderr.decode('utf-8'), int(rc)
 
 
 def _get_version_from_version_file(path):
-    file_path = join(path, '.version')
-    if isfile(file_path):
-        with open(file_path) as fh:
-            return fh.read().strip()
+    # a raw os.open/os.read pair tests existence and reads in two syscalls,
+    # skipping the isfile stat and the buffered text layer; the file only
+    # ever holds a short version string
+    try:
+        fd = os_open(join(path, '.version'), O_RDONLY)
+    except OSError:
+        return None
+    try:
+        data = read(fd, 256)
+    finally:
+        close(fd)
+    return data.decode('utf-8').strip()
+
+
+@lru_cache(maxsize=None)
+def _is_git_dir(path):
+    # walk up toward the filesystem root looking for a .git directory (or
+    # file, for worktrees/submodules); installed packages have none, so we
+    # can skip forking git altogether
+    while True:
+        if exists(join(path, '.git')):
+            return True
+        if ismount(path):
+            return False
+        parent = dirname(path)
+        if parent == path:
+            return False
+        path = parent
+
+
+def _pygit2_describe_tags(path):
+    # in-process libgit2 describe; avoids fork+exec and amortizes ref/pack
+    # reads across calls in the same process
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    try:
+        repo = pygit2.Repository(pygit2.discover_repository(path))
+        return repo.describe(
+            describe_strategy=pygit2.GIT_DESCRIBE_TAGS,
+            always_use_long_format=True,
+        )
+    except Exception as e:
+        # no tags, bare repo, unreadable odb, ... let the git binary decide
+        log.debug("pygit2 describe failed for %s: %r", path, e)
+        return None
 
 
+@lru_cache(maxsize=None)
 def _git_describe_tags(path):
-    try:
-        call("git update-index --refresh", path, raise_on_error=False)
-    except CalledProcessError as e:
-        # git is probably not installed
-        log.warn(repr(e))
+    if not _is_git_dir(path):
         return None
-    response = call("git describe --tags --long", path, raise_on_error=False)
-    if response.rc == 0:
-        return response.stdout.strip()
-    elif response.rc == 128 and "no names found" in response.stderr.lower():
+    tag = _pygit2_describe_tags(path)
+    if tag is not None:
+        return tag
+    stdout, stderr, rc = call(["git", "describe", "--tags", "--long"], path,
+                              raise_on_error=False)
+    if rc == 0:
+        return stdout.strip()
+    elif rc == 128 and "no names found" in stderr.lower():
         # directory is a git repo, but no tags found
         return None
-    elif response.rc == 128 and "not a git repository" in response.stderr.lower():
+    elif rc == 128 and "not a git repository" in stderr.lower():
         return None
-    elif response.rc == 127:
+    elif rc == 127:
         log.error("git not found on path: PATH={}".format(getenv("PATH", None)))
-        raise CalledProcessError(response.rc, response.stderr)
+        raise CalledProcessError(rc, stderr)
     else:
-        raise CalledProcessError(response.rc, response.stderr)
+        raise CalledProcessError(rc, stderr)
 
 
 def _get_version_from_git_tag(tag):
     """Return a PEP440-compliant version derived from the git status.
     If that fails for any reason, return the changeset hash.
     """
-    m = GIT_DESCRIBE_REGEX.match(tag)
-    if m is None:
+    # `git describe --tags --long` emits "<tag>-<post>-g<hash>"; pulling it
+    # apart directly is cheaper than a regex match
+    parts = tag.rsplit('-', 2)
+    if len(parts) != 3:
+        return None
+    version, post_commit, ghash = parts
+    if not post_commit.isdigit() or len(ghash) < 8 or ghash[0] != 'g':
+        return None
+    hash = ghash[1:]
+    if hash.strip('0123456789abcdef'):
+        return None
+    # drop any leading "v"/"release-" style prefix from the tag name
+    for q, char in enumerate(version):
+        if char.isdigit():
+            version = version[q:]
+            break
+    else:
+        return None
+    if '-' in version:
         return None
-    version, post_commit, hash = m.groups()
     return version if post_commit == "0" else f"{version}.post{post_commit}+{hash}"
 
 
+@lru_cache(maxsize=None)
 def _get_version_from_git_clone(path):
-    tag = _git_describe_tags(path) or ''
+    # key on the canonical path so every caller inside one repo shares a
+    # single `git describe` invocation per process
+    tag = _git_describe_tags(abspath(path)) or ''
     return _get_version_from_git_tag(tag)
 
 
+@lru_cache(maxsize=None)
 def get_version(dunder_file):
     """Returns a version string for the current package, derived
     either from git or from a .version file.
@@ -164,12 +224,18 @@ def get_version(dunder_file):
     In an installed context, the .version file written at dist build
     time is the source of version information.
 
+    Setting AUXLIB_PACKAGE_VERSION in the environment overrides both,
+    letting offline/reproducible builds skip git entirely.
+
     """
+    env_version = getenv("AUXLIB_PACKAGE_VERSION")
+    if env_version:
+        return env_version
     path = abspath(expanduser(dirname(dunder_file)))
     try:
         return _get_version_from_version_file(path) or _get_version_from_git_clone(path)
     except CalledProcessError as e:
-        log.warn(repr(e))
+        log.warning(repr(e))
         return None
     except Exception as e:
         log.exception(e)
@@ -181,16 +247,31 @@ def write_version_into_init(target_dir, version):
     assert isfile(target_init_file), f"File not found: {target_init_file}"
     with open(target_init_file) as f:
         init_lines = f.readlines()
-    for q in range(len(init_lines)):
-        if init_lines[q].startswith('__version__'):
-            init_lines[q] = f'__version__ = "{version}"\n'
-        elif (init_lines[q].startswith(('from auxlib', 'import auxlib'))
-              or 'auxlib.packaging' in init_lines[q]):
-            init_lines[q] = None
+    modified = False
+    new_version_line = f'__version__ = "{version}"\n'
+    for q, line in enumerate(init_lines):
+        # one startswith call gates all interesting lines; the slice then
+        # splits version rewrites from auxlib-import removals
+        if (line.startswith(('__version__', 'from auxlib', 'import auxlib'))
+                or 'auxlib.packaging' in line):
+            if line[:11] == '__version__':
+                if line != new_version_line:
+                    init_lines[q] = new_version_line
+                    modified = True
+            else:
+                init_lines[q] = None
+                modified = True
+    if not modified:
+        # version already embedded; skip the rewrite (and the pycache
+        # invalidation that comes with it)
+        return
     print(f"UPDATING {target_init_file}")
-    remove(target_init_file)
-    with open(target_init_file, "w") as f:
+    # write a sibling temp file and atomically swap it in; a crash mid-write
+    # can no longer lose __init__.py
+    tmp_file = target_init_file + ".tmp"
+    with open(tmp_file, "w") as f:
         f.write("".join(filter(None, init_lines)))
+    replace(tmp_file, target_init_file)
 
 
 def write_version_file(target_dir, version):
@@ -201,21 +282,59 @@ def write_version_file(target_dir, version):
         f.write(version)
 
 
-class BuildPyCommand(build_py):
-    def run(self):
-        build_py.run(self)
-        target_dir = join(self.build_lib, self.distribution.metadata.name)
-        write_version_into_init(target_dir, self.distribution.metadata.version)
-        write_version_file(target_dir, self.distribution.metadata.version)
-        # TODO: separate out .version file implementation
+_cached_distribution_version = None
+
+
+def _distribution_version(distribution):
+    # metadata.version is typically derived via git describe; remember the
+    # first answer so build_py and sdist running in one setup.py invocation
+    # agree and git is consulted at most once
+    global _cached_distribution_version
+    if _cached_distribution_version is None:
+        _cached_distribution_version = distribution.metadata.version
+    return _cached_distribution_version
+
+
+def _make_build_py_command():
+    from setuptools.command.build_py import build_py
 
+    class BuildPyCommand(build_py):
+        def run(self):
+            build_py.run(self)
+            version = _distribution_version(self.distribution)
+            target_dir = join(self.build_lib, self.distribution.metadata.name)
+            write_version_into_init(target_dir, version)
+            write_version_file(target_dir, version)
+            # TODO: separate out .version file implementation
 
-class SDistCommand(sdist):
-    def make_release_tree(self, base_dir, files):
-        sdist.make_release_tree(self, base_dir, files)
-        target_dir = join(base_dir, self.distribution.metadata.name)
-        write_version_into_init(target_dir, self.distribution.metadata.version)
-        write_version_file(target_dir, self.distribution.metadata.version)
+    return BuildPyCommand
+
+
+def _make_sdist_command():
+    from setuptools.command.sdist import sdist
+
+    class SDistCommand(sdist):
+        def make_release_tree(self, base_dir, files):
+            sdist.make_release_tree(self, base_dir, files)
+            version = _distribution_version(self.distribution)
+            target_dir = join(base_dir, self.distribution.metadata.name)
+            write_version_into_init(target_dir, version)
+            write_version_file(target_dir, version)
+
+    return SDistCommand
+
+
+def __getattr__(name):
+    # PEP 562: build the setuptools-derived command classes on first access
+    # so get_version() consumers never pay the setuptools import
+    if name == "BuildPyCommand":
+        command = _make_build_py_command()
+    elif name == "SDistCommand":
+        command = _make_sdist_command()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = command
+    return command
 
 
 def convert_path(pathname):
@@ -249,17 +368,27 @@ def convert_path(pathname):
 # swiped from setuptools
 def find_packages(where='.', exclude=()):
     out = []
-    stack = [(convert_path(where), '')]
+    stack = deque([(convert_path(where), '')])
+    # local bindings dodge repeated global/attribute lookups in the hot loop
+    _isfile, _join, _append = isfile, join, out.append
     while stack:
-        where, prefix = stack.pop(0)
-        for name in listdir(where):
-            fn = join(where, name)
-            if "." not in name and isdir(fn) and isfile(join(fn, "__init__.py")):
-                out.append(prefix + name)
-                stack.append((fn, prefix + name + '.'))
-    for pat in list(exclude) + ['ez_setup', 'distribute_setup']:
-        out = [item for item in out if not fnmatchcase(item, pat)]
-    return out
+        where, prefix = stack.popleft()
+        with scandir(where) as entries:
+            for entry in entries:
+                # DirEntry.is_dir comes from the directory read itself,
+                # saving a stat per entry compared to listdir + isdir; the
+                # __init__.py probe is the single remaining stat
+                if ("." not in entry.name
+                        and entry.is_dir()
+                        and _isfile(_join(entry.path, "__init__.py"))):
+                    _append(prefix + entry.name)
+                    stack.append((entry.path, prefix + entry.name + '.'))
+    # one pass with a single alternation instead of a fnmatchcase call per
+    # item x pattern
+    excluded = compile('|'.join(
+        f"(?:{translate(pat)})" for pat in (*exclude, 'ez_setup', 'distribute_setup')
+    ))
+    return [item for item in out if not excluded.match(item)]
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
 import warnings
 from argparse import REMAINDER, SUPPRESS, Action
@@ -10,17 +11,16 @@ from argparse import ArgumentParser as ArgumentParserBase
 from argparse import (
     Namespace,
     RawDescriptionHelpFormatter,
+    _AppendAction,
     _CountAction,
-    _HelpAction,
     _StoreAction,
 )
+from functools import cached_property, lru_cache, partial
 from logging import getLogger
 from os.path import abspath, expanduser, join
-from subprocess import Popen
 from textwrap import dedent
 
 from .. import __version__
-from ..auxlib.compat import isiterable
 from ..auxlib.ish import dals
 from ..base.constants import (
     COMPATIBLE_SHELLS,
@@ -34,34 +34,80 @@ from ..deprecations import deprecated
 
 log = getLogger(__name__)
 
+#: matches the message argparse produces for an unrecognized subcommand
+_INVALID_CHOICE_RE = re.compile(r"invalid choice: u?'([-\w]*?)'")
+
 # duplicated code in the interest of import efficiency
 on_win = bool(sys.platform == "win32")
-user_rc_path = abspath(expanduser("~/.condarc"))
-escaped_user_rc_path = user_rc_path.replace("%", "%%")
-escaped_sys_rc_path = abspath(join(sys.prefix, ".condarc")).replace("%", "%%")
+
+
+@lru_cache(maxsize=None)
+def _user_rc_path():
+    return abspath(expanduser("~/.condarc"))
+
+
+@lru_cache(maxsize=None)
+def _escaped_user_rc_path():
+    return _user_rc_path().replace("%", "%%")
+
+
+@lru_cache(maxsize=None)
+def _escaped_sys_rc_path():
+    return abspath(join(sys.prefix, ".condarc")).replace("%", "%%")
+
+
+@lru_cache(maxsize=None)
+def _escaped_conda_prefix():
+    return os.getenv("CONDA_PREFIX", "<no active environment>").replace("%", "%%")
+
 
 #: List of a built-in commands; these cannot be overriden by plugin subcommands
-BUILTIN_COMMANDS = {
-    "clean",
-    "compare",
-    "config",
-    "create",
-    "info",
-    "init",
-    "install",
-    "list",
-    "package",
-    "remove",
-    "rename",
-    "run",
-    "search",
-    "update",
-    "upgrade",
-    "notices",
-}
+#: (interned so membership tests hit the pointer-equality fast path)
+BUILTIN_COMMANDS = frozenset(
+    map(
+        sys.intern,
+        {
+            "clean",
+            "compare",
+            "config",
+            "create",
+            "info",
+            "init",
+            "install",
+            "list",
+            "package",
+            "remove",
+            "rename",
+            "run",
+            "search",
+            "update",
+            "upgrade",
+            "notices",
+        },
+    )
+)
 
 
-def generate_parser():
+def _sniff_subcommand(argv):
+    """Return the subcommand name targeted by ``argv``, or None when every
+    subparser must be built (root help, version, unknown commands).
+    """
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            # root help must enumerate every subcommand
+            return None
+        if not arg.startswith("-"):
+            return arg if arg in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def generate_parser(argv=None):
+    """Build the conda argument parser.
+
+    When ``argv`` is given, only the subparser it targets is constructed;
+    anything else (help, version, unknown or legacy commands) falls back to
+    building all subparsers so error and help output are unchanged.
+    """
     p = ArgumentParser(
         description="conda is a tool for managing and deploying applications,"
         " environments and packages.",
@@ -89,25 +135,25 @@ def generate_parser():
         required=True,
     )
 
-    configure_parser_clean(sub_parsers)
-    configure_parser_compare(sub_parsers)
-    configure_parser_config(sub_parsers)
-    configure_parser_create(sub_parsers)
-    configure_parser_info(sub_parsers)
-    configure_parser_init(sub_parsers)
-    configure_parser_install(sub_parsers)
-    configure_parser_list(sub_parsers)
-    configure_parser_package(sub_parsers)
-    configure_parser_remove(sub_parsers, aliases=["uninstall"])
-    configure_parser_rename(sub_parsers)
-    configure_parser_run(sub_parsers)
-    configure_parser_search(sub_parsers)
-    configure_parser_update(sub_parsers, aliases=["upgrade"])
-    configure_parser_notices(sub_parsers)
+    if argv and argv[0] in ("-V", "--version"):
+        # the version action prints and exits before the subcommand
+        # positional is ever consulted; build no subparsers at all
+        return p
+
+    target = _sniff_subcommand(argv) if argv is not None else None
+    if target is not None:
+        _SUBCOMMAND_BUILDERS[target](sub_parsers)
+    else:
+        for builder in _UNIQUE_SUBCOMMAND_BUILDERS:
+            builder(sub_parsers)
 
     return p
 
 
+#: resolved ``(callable, command)`` dispatch entries keyed on ``args.func``
+_FUNC_CACHE = {}
+
+
 def do_call(args, parser):
     """
     Serves as the primary entry point for commands referred to in this file and for
@@ -118,16 +164,36 @@ def do_call(args, parser):
         _run_pre_command_hooks(args.plugin_subcommand.name, args)
         return args.plugin_subcommand.action(sys.argv[2:])
 
-    relative_mod, func_name = args.func.rsplit(".", 1)
-    # func_name should always be 'execute'
-    from importlib import import_module
+    entry = _FUNC_CACHE.get(args.func)
+    if entry is None:
+        precomputed = getattr(args, "_entry", None)
+        if precomputed is not None:
+            relative_mod, func_name, command = precomputed
+        else:
+            relative_mod, func_name = args.func.rsplit(".", 1)
+            # func_name should always be 'execute'
+            command = relative_mod.replace(".main_", "")
+        from importlib import import_module
 
-    module = import_module(relative_mod, __name__.rsplit(".", 1)[0])
+        module = import_module(relative_mod, __name__.rsplit(".", 1)[0])
+        entry = _FUNC_CACHE[args.func] = (getattr(module, func_name), command)
 
-    command = relative_mod.replace(".main_", "")
+    func, command = entry
     _run_pre_command_hooks(command, args)
 
-    return getattr(module, func_name)(args, parser)
+    return func(args, parser)
+
+
+def _set_entry(p, command):
+    # precompute the dispatch triple consumed by do_call; ``func`` is kept in
+    # its historical string form for callers that inspect it. The runtime-
+    # built strings are interned so _FUNC_CACHE lookups compare by pointer
+    # (dest literals need no such help; identifier-like constants are already
+    # interned by the compiler).
+    p.set_defaults(
+        func=sys.intern(f".main_{command}.execute"),
+        _entry=(sys.intern(f".main_{command}"), "execute", command),
+    )
 
 
 def _run_pre_command_hooks(command: str, args) -> None:
@@ -164,36 +230,55 @@ class ArgumentParser(ArgumentParserBase):
         if self.description:
             self.description += "\n\nOptions:\n"
 
-        self._subcommands = context.plugin_manager.get_hook_results("subcommands")
-
-        if self._subcommands:
+    @cached_property
+    def _subcommands(self):
+        # plugin discovery is deferred until a parser actually needs it
+        # (parse_args on the root parser, or help formatting); building the
+        # fifteen-odd subparsers no longer hits the plugin manager at all
+        return context.plugin_manager.get_hook_results("subcommands")
+
+    @cached_property
+    def _plugin_subcommands_by_name(self):
+        return {
+            sys.intern(subcommand.name): subcommand for subcommand in self._subcommands
+        }
+
+    def format_help(self):
+        if self.epilog is None and self._subcommands:
             self.epilog = "conda commands available from other packages:" + "".join(
                 f"\n {subcommand.name} - {subcommand.summary}"
                 for subcommand in self._subcommands
             )
+        return super().format_help()
+
+    @cached_property
+    def _actions_by_name(self):
+        # built on first error; actions added through argument groups bypass
+        # _add_action, so the tables cannot be maintained incrementally
+        by_joined_opts, by_metavar, by_dest = {}, {}, {}
+        for action in self._actions:
+            # first registration wins, matching the linear scan this replaces
+            by_joined_opts.setdefault("/".join(action.option_strings), action)
+            if action.metavar is not None:
+                by_metavar.setdefault(action.metavar, action)
+            by_dest.setdefault(action.dest, action)
+        return by_joined_opts, by_metavar, by_dest
 
     def _get_action_from_name(self, name):
         """Given a name, get the Action instance registered with this parser.
         If only it were made available in the ArgumentError object. It is
         passed as it's first arg...
         """
-        container = self._actions
         if name is None:
             return None
-        for action in container:
-            if "/".join(action.option_strings) == name:
-                return action
-            elif action.metavar == name:
-                return action
-            elif action.dest == name:
-                return action
+        by_joined_opts, by_metavar, by_dest = self._actions_by_name
+        return by_joined_opts.get(name) or by_metavar.get(name) or by_dest.get(name)
 
     def error(self, message):
-        import re
-
-        from .find_commands import find_executable
-
-        exc = sys.exc_info()[1]
+        # the legacy-subcommand recovery below only applies to an
+        # unrecognized `cmd` positional, so skip the exc_info unwind for
+        # every other error (the common case)
+        exc = sys.exc_info()[1] if "invalid choice" in message else None
         if exc:
             # this is incredibly lame, but argparse stupidly does not expose
             # reasonable hooks for customizing error handling
@@ -202,7 +287,7 @@ class ArgumentParser(ArgumentParserBase):
             else:
                 argument = None
             if argument and argument.dest == "cmd":
-                m = re.match(r"invalid choice: u?'([-\w]*?)'", exc.message)
+                m = _INVALID_CHOICE_RE.match(exc.message)
                 if m:
                     cmd = m.group(1)
                     if not cmd:
@@ -216,12 +301,14 @@ class ArgumentParser(ArgumentParserBase):
                             topic="Loading conda subcommands via executables",
                             addendum="Use the plugin system instead.",
                         )
+                        from .find_commands import find_executable
+
                         executable = find_executable("conda-" + cmd)
                         if not executable:
                             from ..exceptions import CommandNotFoundError
 
                             raise CommandNotFoundError(cmd)
-                        args = [find_executable("conda-" + cmd)]
+                        args = [executable]
                         args.extend(sys.argv[2:])
                         _exec(args, os.environ)
 
@@ -242,9 +329,13 @@ class ArgumentParser(ArgumentParserBase):
 
     def _check_value(self, action, value):
         # extend to properly handle when we accept multiple choices and the default is a list
-        if action.choices is not None and isiterable(value):
+        if action.choices is None:
+            # nothing to validate; skip the isinstance probe and super call
+            return
+        if isinstance(value, (list, tuple)):
+            check = super()._check_value
             for element in value:
-                super()._check_value(action, element)
+                check(action, element)
         else:
             super()._check_value(action, value)
 
@@ -259,23 +350,22 @@ class ArgumentParser(ArgumentParserBase):
         if args is None:
             args = sys.argv[1:]
 
-        plugin_subcommand = None
-        if args:
+        # self._subcommands is empty unless plugin subcommands are installed,
+        # so the common case is a single falsy check before delegating
+        if args and self._subcommands:
             name = args[0]
-            for subcommand in self._subcommands:
-                if subcommand.name == name:
-                    if name.lower() in BUILTIN_COMMANDS:
-                        error_message = dals(
-                            f"The plugin '{subcommand.name}: {subcommand.summary}' is trying "
-                            f"to override the built-in command {name}, which is not allowed. "
-                            "Please uninstall this plugin to stop seeing this error message"
-                        )
-                        log.error(error_message)
-                    else:
-                        plugin_subcommand = Namespace(plugin_subcommand=subcommand)
-
-        if plugin_subcommand is not None:
-            return plugin_subcommand
+            subcommand = self._plugin_subcommands_by_name.get(name)
+            if subcommand is not None:
+                # builtin names are all lowercase; normalize only when needed
+                if (name if name.islower() else name.lower()) in BUILTIN_COMMANDS:
+                    error_message = dals(
+                        f"The plugin '{subcommand.name}: {subcommand.summary}' is trying "
+                        f"to override the built-in command {name}, which is not allowed. "
+                        "Please uninstall this plugin to stop seeing this error message"
+                    )
+                    log.error(error_message)
+                else:
+                    return Namespace(plugin_subcommand=subcommand)
 
         return super().parse_args(args, namespace)
 
@@ -285,6 +375,14 @@ def _exec(executable_args, env_vars):
 
 
 def _exec_win(executable_args, env_vars):
+    # NOTE: os.execvpe is NOT an option here. The Windows CRT emulates exec
+    # by spawning a child under a new PID and terminating the caller, so a
+    # shell or CI wrapper waiting on conda's PID resumes while the legacy
+    # subcommand is still writing to the console, and its exit code is lost.
+    # Popen+wait keeps PID and exit-code semantics, and allocates no pipes
+    # when stdout/stderr are not redirected.
+    from subprocess import Popen
+
     p = Popen(executable_args, env=env_vars)
     try:
         p.communicate()
@@ -295,7 +393,12 @@ def _exec_win(executable_args, env_vars):
 
 
 def _exec_unix(executable_args, env_vars):
-    os.execvpe(executable_args[0], executable_args, env_vars)
+    executable = executable_args[0]
+    if os.path.isabs(executable):
+        # error() hands us the find_executable result; no PATH walk needed
+        os.execve(executable, executable_args, env_vars)
+    else:
+        os.execvpe(executable, executable_args, env_vars)
 
 
 class NullCountAction(_CountAction):
@@ -339,9 +442,23 @@ class ExtendConstAction(Action):
 
     def __call__(self, parser, namespace, values, option_string=None):
         items = getattr(namespace, self.dest, None)
-        items = [] if items is None else items[:]
+        if items is None or items is self.default:
+            # never mutate a (possibly shared) default; start from a copy
+            items = [] if items is None else list(items)
+            setattr(namespace, self.dest, items)
         items.extend(values or [self.const])
-        setattr(namespace, self.dest, items)
+
+
+class InPlaceAppendAction(_AppendAction):
+    # argparse's _AppendAction copies the accumulated list on every
+    # occurrence to protect shared defaults, making N repetitions O(N^2);
+    # an identity check against the default achieves the same protection
+    def __call__(self, parser, namespace, values, option_string=None):
+        items = getattr(namespace, self.dest, None)
+        if items is None or items is self.default:
+            items = [] if items is None else list(items)
+            setattr(namespace, self.dest, items)
+        items.append(values)
 
 
 class PendingDeprecationAction(_StoreAction):
@@ -368,57 +485,62 @@ class DeprecatedAction(_StoreAction):
 # #############################################################################################
 
 
-def configure_parser_clean(sub_parsers):
-    descr = "Remove unused packages and caches."
-    example = dals(
-        """
-        Examples::
-
-            conda clean --tarballs
-        """
-    )
-    p = sub_parsers.add_parser(
-        "clean",
-        description=descr,
-        help=descr,
-        epilog=example,
-    )
-
-    removal_target_options = p.add_argument_group("Removal Targets")
-    removal_target_options.add_argument(
+#: (short, long, help) triples for the plain store_true removal targets of
+#: `conda clean`, added in one data-driven pass
+_CLEAN_REMOVAL_FLAGS = (
+    (
         "-a",
         "--all",
-        action="store_true",
-        help="Remove index cache, lock files, unused cache packages, tarballs, and logfiles.",
-    )
-    removal_target_options.add_argument(
+        "Remove index cache, lock files, unused cache packages, tarballs, and logfiles.",
+    ),
+    (
         "-i",
         "--index-cache",
-        action="store_true",
-        help="Remove index cache.",
-    )
-    removal_target_options.add_argument(
+        "Remove index cache.",
+    ),
+    (
         "-p",
         "--packages",
-        action="store_true",
-        help="Remove unused packages from writable package caches. "
+        "Remove unused packages from writable package caches. "
         "WARNING: This does not check for packages installed using "
         "symlinks back to the package cache.",
-    )
-    removal_target_options.add_argument(
+    ),
+    (
         "-t",
         "--tarballs",
-        action="store_true",
-        help="Remove cached package tarballs.",
-    )
-    removal_target_options.add_argument(
+        "Remove cached package tarballs.",
+    ),
+    (
         "-f",
         "--force-pkgs-dirs",
-        action="store_true",
-        help="Remove *all* writable package caches. This option is not included with the --all "
+        "Remove *all* writable package caches. This option is not included with the --all "
         "flag. WARNING: This will break environments with packages installed using symlinks "
         "back to the package cache.",
+    ),
+)
+
+
+_CLEAN_EXAMPLE = """Examples::
+
+    conda clean --tarballs
+"""
+
+
+def configure_parser_clean(sub_parsers):
+    descr = "Remove unused packages and caches."
+    example = _CLEAN_EXAMPLE
+    p = sub_parsers.add_parser(
+        "clean",
+        description=descr,
+        help=descr,
+        epilog=example,
     )
+
+    removal_target_options = p.add_argument_group("Removal Targets")
+    for short, long, help_ in _CLEAN_REMOVAL_FLAGS:
+        removal_target_options.add_argument(
+            short, long, action="store_true", help=help_
+        )
     removal_target_options.add_argument(
         "-c",  # for tempfile extension (.c~)
         "--tempfiles",
@@ -439,7 +561,18 @@ def configure_parser_clean(sub_parsers):
 
     add_output_and_prompt_options(p)
 
-    p.set_defaults(func=".main_clean.execute")
+    _set_entry(p, "clean")
+
+
+#: (flags, help) pairs for the plain store_true options of `conda info`
+# TODO: deprecate 'conda info --envs' and create 'conda list --envs'
+_INFO_FLAGS = (
+    (("-a", "--all"), "Show all information."),
+    (("--base",), "Display base environment path."),
+    (("-e", "--envs"), "List all known conda environments."),
+    (("-l", "--license"), SUPPRESS),
+    (("-s", "--system"), "List environment variables."),
+)
 
 
 def configure_parser_info(sub_parsers):
@@ -454,39 +587,11 @@ def configure_parser_info(sub_parsers):
     p.add_argument(
         "--offline",
         action="store_true",
-        default=NULL,
-        help=SUPPRESS,
-    )
-    p.add_argument(
-        "-a",
-        "--all",
-        action="store_true",
-        help="Show all information.",
-    )
-    p.add_argument(
-        "--base",
-        action="store_true",
-        help="Display base environment path.",
-    )
-    # TODO: deprecate 'conda info --envs' and create 'conda list --envs'
-    p.add_argument(
-        "-e",
-        "--envs",
-        action="store_true",
-        help="List all known conda environments.",
-    )
-    p.add_argument(
-        "-l",
-        "--license",
-        action="store_true",
+        default=SUPPRESS,
         help=SUPPRESS,
     )
-    p.add_argument(
-        "-s",
-        "--system",
-        action="store_true",
-        help="List environment variables.",
-    )
+    for flags, help_ in _INFO_FLAGS:
+        p.add_argument(*flags, action="store_true", help=help_)
     p.add_argument(
         "--root",
         action="store_true",
@@ -506,10 +611,13 @@ def configure_parser_info(sub_parsers):
         help=SUPPRESS,
     )
 
-    p.set_defaults(func=".main_info.execute")
+    _set_entry(p, "info")
 
 
-def configure_parser_config(sub_parsers):
+@lru_cache(maxsize=None)
+def _config_descriptions():
+    # building these involves dedenting and interpolating a few KB of text;
+    # do it at most once per process
     descr = (
         dedent(
             """
@@ -520,7 +628,7 @@ def configure_parser_config(sub_parsers):
 
     """
         )
-        % escaped_user_rc_path
+        % _escaped_user_rc_path()
     )
 
     # Note, the extra whitespace in the list keys is on purpose. It's so the
@@ -571,6 +679,11 @@ def configure_parser_config(sub_parsers):
         )
         % CONDA_HOMEPAGE_URL
     )
+    return descr, additional_descr
+
+
+def configure_parser_config(sub_parsers):
+    descr, additional_descr = _config_descriptions()
 
     p = sub_parsers.add_parser(
         "config",
@@ -584,13 +697,13 @@ def configure_parser_config(sub_parsers):
     config_file_location_group = p.add_argument_group(
         "Config File Location Selection",
         "Without one of these flags, the user config file at '%s' is used."
-        % escaped_user_rc_path,
+        % _escaped_user_rc_path(),
     )
     location = config_file_location_group.add_mutually_exclusive_group()
     location.add_argument(
         "--system",
         action="store_true",
-        help="Write to the system .condarc file at '%s'." % escaped_sys_rc_path,
+        help="Write to the system .condarc file at '%s'." % _escaped_sys_rc_path(),
     )
     location.add_argument(
         "--env",
@@ -599,8 +712,8 @@ def configure_parser_config(sub_parsers):
         "If no environment is active, write to the user config file (%s)."
         ""
         % (
-            os.getenv("CONDA_PREFIX", "<no active environment>").replace("%", "%%"),
-            escaped_user_rc_path,
+            _escaped_conda_prefix(),
+            _escaped_user_rc_path(),
         ),
     )
     location.add_argument("--file", action="store", help="Write to the given file.")
@@ -708,7 +821,21 @@ def configure_parser_config(sub_parsers):
         help=SUPPRESS,  # TODO: No longer used.  Remove in a future release.
     )
 
-    p.set_defaults(func=".main_config.execute")
+    _set_entry(p, "config")
+
+
+_CREATE_EXAMPLE = """
+Examples:
+
+Create an environment containing the package 'sqlite'::
+
+    conda create -n myenv sqlite
+
+Create an environment (env2) as a clone of an existing environment (env1)::
+
+    conda create -n env2 --clone path/to/file/env1
+
+"""
 
 
 def configure_parser_create(sub_parsers):
@@ -719,20 +846,7 @@ def configure_parser_create(sub_parsers):
         "option."
     )
 
-    example = dedent(
-        """
-    Examples:
-
-    Create an environment containing the package 'sqlite'::
-
-        conda create -n myenv sqlite
-
-    Create an environment (env2) as a clone of an existing environment (env1)::
-
-        conda create -n env2 --clone path/to/file/env1
-
-    """
-    )
+    example = _CREATE_EXAMPLE
     p = sub_parsers.add_parser(
         "create",
         description=descr,
@@ -756,42 +870,35 @@ def configure_parser_create(sub_parsers):
         action="store_true",
         help=SUPPRESS,
     )
-    p.add_argument(
-        "--dev",
-        action=NullCountAction,
-        help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
-        "This is mainly for use during tests where we test new conda sources "
-        "against old Python versions.",
-        dest="dev",
-        default=NULL,
-    )
-    p.set_defaults(func=".main_create.execute")
+    p.add_argument("--dev", **_DEV_KW)
+    _set_entry(p, "create")
+
+
+_INIT_EPILOG = """\
+Key parts of conda's functionality require that it interact directly with the shell
+within which conda is being invoked. The `conda activate` and `conda deactivate` commands
+specifically are shell-level commands. That is, they affect the state (e.g. environment
+variables) of the shell context being interacted with. Other core commands, like
+`conda create` and `conda install`, also necessarily interact with the shell environment.
+They're therefore implemented in ways specific to each shell. Each shell must be configured
+to make use of them.
+
+This command makes changes to your system that are specific and customized for each shell.
+To see the specific files and locations on your system that will be affected before, use
+the '--dry-run' flag.  To see the exact changes that are being or will be made to each
+location, use the '--verbose' flag.
+
+IMPORTANT: After running `conda init`, most shells will need to be closed and restarted for
+changes to take effect.
+
+"""
 
 
 def configure_parser_init(sub_parsers):
     help = "Initialize conda for shell interaction."
     descr = help
 
-    epilog = dals(
-        """
-        Key parts of conda's functionality require that it interact directly with the shell
-        within which conda is being invoked. The `conda activate` and `conda deactivate` commands
-        specifically are shell-level commands. That is, they affect the state (e.g. environment
-        variables) of the shell context being interacted with. Other core commands, like
-        `conda create` and `conda install`, also necessarily interact with the shell environment.
-        They're therefore implemented in ways specific to each shell. Each shell must be configured
-        to make use of them.
-
-        This command makes changes to your system that are specific and customized for each shell.
-        To see the specific files and locations on your system that will be affected before, use
-        the '--dry-run' flag.  To see the exact changes that are being or will be made to each
-        location, use the '--verbose' flag.
-
-        IMPORTANT: After running `conda init`, most shells will need to be closed and restarted for
-        changes to take effect.
-
-        """
-    )
+    epilog = _INIT_EPILOG
 
     # dev_example = dedent("""
     #     # An example for creating an environment to develop on conda's own code. Clone the
@@ -894,12 +1001,32 @@ def configure_parser_init(sub_parsers):
         action="store_true",
         help="Only display what would have been done.",
     )
-    p.set_defaults(func=".main_init.execute")
+    _set_entry(p, "init")
+
+
+_INSTALL_EXAMPLE = """
+Examples:
+
+Install the package 'scipy' into the currently-active environment::
+
+    conda install scipy
+
+Install a list of packages into an environment, myenv::
+
+    conda install -n myenv scipy curl wheel
+
+Install a specific version of 'python' into an environment, myenv::
+
+    conda install -p path/to/myenv python=3.11
+
+"""
 
 
 def configure_parser_install(sub_parsers):
     help = "Installs a list of packages into a specified conda environment."
-    descr = dedent(
+    # NOTE: dedent was a no-op on this text (the first line has no indent);
+    # plain concatenation preserves the historical output
+    descr = (
         help
         + """
 
@@ -923,26 +1050,9 @@ def configure_parser_install(sub_parsers):
     (e.g. ./lxml-3.2.0-py27_0.tar.bz2). Using conda in this mode implies the
     --no-deps option, and should likewise be used with great caution. Explicit
     filenames and package specifications cannot be mixed in a single command.
-    """
-    )
-    example = dedent(
-        """
-    Examples:
-
-    Install the package 'scipy' into the currently-active environment::
-
-        conda install scipy
-
-    Install a list of packages into an environment, myenv::
-
-        conda install -n myenv scipy curl wheel
-
-    Install a specific version of 'python' into an environment, myenv::
-
-        conda install -p path/to/myenv python=3.11
-
-    """
+"""
     )
+    example = _INSTALL_EXAMPLE
     p = sub_parsers.add_parser(
         "install",
         description=descr,
@@ -963,9 +1073,8 @@ def configure_parser_install(sub_parsers):
     solver_mode_options.add_argument(
         "--force-reinstall",
         action="store_true",
-        default=NULL,
-        help="Ensure that any user-requested package for the current operation is uninstalled and "
-        "reinstalled, even if that package already exists in the environment.",
+        default=SUPPRESS,
+        help=_FORCE_REINSTALL_HELP,
     )
     add_parser_update_modifiers(solver_mode_options)
     package_install_options.add_argument(
@@ -977,63 +1086,55 @@ def configure_parser_install(sub_parsers):
     package_install_options.add_argument(
         "--clobber",
         action="store_true",
-        default=NULL,
+        default=SUPPRESS,
         help="Allow clobbering (i.e. overwriting) of overlapping file paths "
         "within packages and suppress related warnings.",
     )
-    p.add_argument(
-        "--dev",
-        action=NullCountAction,
-        help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
-        "This is mainly for use during tests where we test new conda sources "
-        "against old Python versions.",
-        dest="dev",
-        default=NULL,
-    )
-    p.set_defaults(func=".main_install.execute")
+    p.add_argument("--dev", **_DEV_KW)
+    _set_entry(p, "install")
 
 
-def configure_parser_list(sub_parsers):
-    descr = "List installed packages in a conda environment."
+_LIST_EXAMPLES = """
+Examples:
 
-    # Note, the formatting of this is designed to work well with help2man
-    examples = dedent(
-        """
-    Examples:
+List all packages in the current environment::
 
-    List all packages in the current environment::
+    conda list
 
-        conda list
+List all packages in reverse order::
 
-    List all packages in reverse order::
+    conda list --reverse
 
-        conda list --reverse
+List all packages installed into the environment 'myenv'::
 
-    List all packages installed into the environment 'myenv'::
+    conda list -n myenv
 
-        conda list -n myenv
+List all packages that begin with the letters "py", using regex::
 
-    List all packages that begin with the letters "py", using regex::
+    conda list ^py
 
-        conda list ^py
+Save packages for future use::
 
-    Save packages for future use::
+    conda list --export > package-list.txt
 
-        conda list --export > package-list.txt
+Reinstall packages from an export file::
 
-    Reinstall packages from an export file::
+    conda create -n myenv --file package-list.txt
 
-        conda create -n myenv --file package-list.txt
+"""
 
-    """
-    )
+
+def configure_parser_list(sub_parsers):
+    descr = "List installed packages in a conda environment."
+
+    # Note, the formatting of this is designed to work well with help2man
+    examples = _LIST_EXAMPLES
     p = sub_parsers.add_parser(
         "list",
         description=descr,
         help=descr,
-        formatter_class=RawDescriptionHelpFormatter,
         epilog=examples,
-        add_help=False,
+        **_RAW_KW,
     )
     add_parser_help(p)
     add_parser_prefix(p)
@@ -1096,36 +1197,36 @@ def configure_parser_list(sub_parsers):
         nargs="?",
         help="List only packages matching this regular expression.",
     )
-    p.set_defaults(func=".main_list.execute")
+    _set_entry(p, "list")
 
 
-def configure_parser_compare(sub_parsers):
-    descr = "Compare packages between conda environments."
+_COMPARE_EXAMPLES = """
+Examples:
 
-    # Note, the formatting of this is designed to work well with help2man
-    examples = dedent(
-        """
-    Examples:
+Compare packages in the current environment with respect
+to 'environment.yml' located in the current working directory::
 
-    Compare packages in the current environment with respect
-    to 'environment.yml' located in the current working directory::
+    conda compare environment.yml
 
-        conda compare environment.yml
+Compare packages installed into the environment 'myenv' with respect
+to 'environment.yml' in a different directory::
 
-    Compare packages installed into the environment 'myenv' with respect
-    to 'environment.yml' in a different directory::
+    conda compare -n myenv path/to/file/environment.yml
 
-        conda compare -n myenv path/to/file/environment.yml
+"""
 
-    """
-    )
+
+def configure_parser_compare(sub_parsers):
+    descr = "Compare packages between conda environments."
+
+    # Note, the formatting of this is designed to work well with help2man
+    examples = _COMPARE_EXAMPLES
     p = sub_parsers.add_parser(
         "compare",
         description=descr,
         help=descr,
-        formatter_class=RawDescriptionHelpFormatter,
         epilog=examples,
-        add_help=False,
+        **_RAW_KW,
     )
     add_parser_help(p)
     add_parser_json(p)
@@ -1135,7 +1236,7 @@ def configure_parser_compare(sub_parsers):
         action="store",
         help="Path to the environment file that is to be compared against.",
     )
-    p.set_defaults(func=".main_compare.execute")
+    _set_entry(p, "compare")
 
 
 def configure_parser_package(sub_parsers):
@@ -1184,51 +1285,50 @@ def configure_parser_package(sub_parsers):
         default=0,
         help="Designate package build number of the package being created.",
     )
-    p.set_defaults(func=".main_package.execute")
+    _set_entry(p, "package")
 
 
-def configure_parser_remove(sub_parsers, aliases):
-    help_ = (
-        "Remove a list of packages from a specified conda environment. "
-        "Use `--all` flag to remove all packages and the environment itself."
-    )
-    descr = dals(
-        f"""
-        {help_}
+#: pre-dedented template; one .format call replaces a dals pass per build
+_REMOVE_DESCR_TMPL = """{help_}
 
-        This command will also remove any package that depends on any of the
-        specified packages as well---unless a replacement can be found without
-        that dependency. If you wish to skip this dependency checking and remove
-        just the requested packages, add the '--force' option. Note however that
-        this may result in a broken environment, so use this with caution.
-        """
-    )
-    example = dals(
-        """
-        Examples:
+This command will also remove any package that depends on any of the
+specified packages as well---unless a replacement can be found without
+that dependency. If you wish to skip this dependency checking and remove
+just the requested packages, add the '--force' option. Note however that
+this may result in a broken environment, so use this with caution.
+"""
 
-        Remove the package 'scipy' from the currently-active environment::
+_REMOVE_EXAMPLE = """Examples:
 
-            conda remove scipy
+Remove the package 'scipy' from the currently-active environment::
 
-        Remove a list of packages from an environemnt 'myenv'::
+    conda remove scipy
 
-            conda remove -n myenv scipy curl wheel
+Remove a list of packages from an environemnt 'myenv'::
 
-        Remove all packages from environment `myenv` and the environment itself::
+    conda remove -n myenv scipy curl wheel
 
-            conda remove -n myenv --all
+Remove all packages from environment `myenv` and the environment itself::
 
-        """
+    conda remove -n myenv --all
+
+"""
+
+
+def configure_parser_remove(sub_parsers, aliases):
+    help_ = (
+        "Remove a list of packages from a specified conda environment. "
+        "Use `--all` flag to remove all packages and the environment itself."
     )
+    descr = _REMOVE_DESCR_TMPL.format(help_=help_)
+    example = _REMOVE_EXAMPLE
     p = sub_parsers.add_parser(
         "remove",
-        formatter_class=RawDescriptionHelpFormatter,
         description=descr,
         help=help_,
         epilog=example,
-        add_help=False,
         aliases=aliases,
+        **_RAW_KW,
     )
     add_parser_help(p)
     add_parser_pscheck(p)
@@ -1260,7 +1360,7 @@ def configure_parser_remove(sub_parsers, aliases):
         "--no-pin",
         action="store_true",
         dest="ignore_pinned",
-        default=NULL,
+        default=SUPPRESS,
         help="Ignore pinned package(s) that apply to the current operation. "
         "These pinned packages might come from a .condarc file or a file in "
         "<TARGET_ENVIRONMENT>/conda-meta/pinned.",
@@ -1278,31 +1378,24 @@ def configure_parser_remove(sub_parsers, aliases):
         nargs="*",
         help="Package names to remove from the environment.",
     )
-    p.add_argument(
-        "--dev",
-        action=NullCountAction,
-        help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
-        "This is mainly for use during tests where we test new conda sources "
-        "against old Python versions.",
-        dest="dev",
-        default=NULL,
-    )
+    p.add_argument("--dev", **_DEV_KW)
+
+    _set_entry(p, "remove")
+
+
+_RUN_EXAMPLE = """
 
-    p.set_defaults(func=".main_remove.execute")
+Example usage::
+
+    $ conda create -y -n my-python-env python=3
+    $ conda run -n my-python-env python --version
+"""
 
 
 def configure_parser_run(sub_parsers):
     help = "Run an executable in a conda environment."
     descr = help
-    example = dedent(
-        """
-
-    Example usage::
-
-        $ conda create -y -n my-python-env python=3
-        $ conda run -n my-python-env python --version
-    """
-    )
+    example = _RUN_EXAMPLE
 
     p = sub_parsers.add_parser(
         "run",
@@ -1312,14 +1405,7 @@ def configure_parser_run(sub_parsers):
     )
 
     add_parser_prefix(p)
-    p.add_argument(
-        "-v",
-        "--verbose",
-        action=NullCountAction,
-        help="Use once for info, twice for debug, three times for trace.",
-        dest="verbosity",
-        default=NULL,
-    )
+    p.add_argument("-v", "--verbose", **_VERBOSE_KW)
 
     p.add_argument(
         "--dev",
@@ -1345,7 +1431,9 @@ def configure_parser_run(sub_parsers):
         "--cwd",
         help="Current working directory for command to run in. Defaults to "
         "the user's current working directory if no directory is specified.",
-        default=os.getcwd(),
+        # None means "cwd at execution time"; resolving getcwd here would
+        # cost a syscall at parser build and freeze the wrong directory
+        default=None,
     )
     p.add_argument(
         "--no-capture-output",
@@ -1362,51 +1450,52 @@ def configure_parser_run(sub_parsers):
         "on invocation.",
     )
 
-    p.set_defaults(func=".main_run.execute")
+    _set_entry(p, "run")
 
 
-def configure_parser_search(sub_parsers):
-    help = "Search for packages and display associated information."
-    descr = (
-        help
-        + """The input is a MatchSpec, a query language for conda packages.
-    See examples below.
-    """
-    )
+_SEARCH_EXAMPLE = """
+Examples:
 
-    example = dedent(
-        """
-    Examples:
+Search for a specific package named 'scikit-learn'::
 
-    Search for a specific package named 'scikit-learn'::
+    conda search scikit-learn
 
-        conda search scikit-learn
+Search for packages containing 'scikit' in the package name::
 
-    Search for packages containing 'scikit' in the package name::
+    conda search *scikit*
 
-        conda search *scikit*
+Note that your shell may expand '*' before handing the command over to conda.
+Therefore, it is sometimes necessary to use single or double quotes around the query::
 
-    Note that your shell may expand '*' before handing the command over to conda.
-    Therefore, it is sometimes necessary to use single or double quotes around the query::
+    conda search '*scikit'
+    conda search "*scikit*"
 
-        conda search '*scikit'
-        conda search "*scikit*"
+Search for packages for 64-bit Linux (by default, packages for your current
+platform are shown)::
 
-    Search for packages for 64-bit Linux (by default, packages for your current
-    platform are shown)::
+    conda search numpy[subdir=linux-64]
 
-        conda search numpy[subdir=linux-64]
+Search for a specific version of a package::
 
-    Search for a specific version of a package::
+    conda search 'numpy>=1.12'
 
-        conda search 'numpy>=1.12'
+Search for a package on a specific channel::
 
-    Search for a package on a specific channel::
+    conda search conda-forge::numpy
+    conda search 'numpy[channel=conda-forge, subdir=osx-64]'
+"""
 
-        conda search conda-forge::numpy
-        conda search 'numpy[channel=conda-forge, subdir=osx-64]'
+
+def configure_parser_search(sub_parsers):
+    help = "Search for packages and display associated information."
+    descr = (
+        help
+        + """The input is a MatchSpec, a query language for conda packages.
+    See examples below.
     """
     )
+
+    example = _SEARCH_EXAMPLE
     p = sub_parsers.add_parser(
         "search",
         description=descr,
@@ -1480,34 +1569,34 @@ def configure_parser_search(sub_parsers):
     add_parser_channels(p)
     add_parser_networking(p)
     add_parser_json(p)
-    p.set_defaults(func=".main_search.execute")
+    _set_entry(p, "search")
 
 
-def configure_parser_update(sub_parsers, aliases):
-    help_ = "Updates conda packages to the latest compatible version."
-    descr = dals(
-        f"""
-        {help_}
-
-        This command accepts a list of package names and updates them to the latest
-        versions that are compatible with all other packages in the environment.
-
-        Conda attempts to install the newest versions of the requested packages. To
-        accomplish this, it may update some packages that are already installed, or
-        install additional packages. To prevent existing packages from updating,
-        use the --no-update-deps option. This may force conda to install older
-        versions of the requested packages, and it does not prevent additional
-        dependency packages from being installed.
-        """
-    )
-    example = dals(
-        """
-        Examples:
+_UPDATE_EXAMPLE = """Examples:
 
-            conda update -n myenv scipy
+    conda update -n myenv scipy
 
-        """
-    )
+"""
+
+
+_UPDATE_DESCR_TMPL = """{help_}
+
+This command accepts a list of package names and updates them to the latest
+versions that are compatible with all other packages in the environment.
+
+Conda attempts to install the newest versions of the requested packages. To
+accomplish this, it may update some packages that are already installed, or
+install additional packages. To prevent existing packages from updating,
+use the --no-update-deps option. This may force conda to install older
+versions of the requested packages, and it does not prevent additional
+dependency packages from being installed.
+"""
+
+
+def configure_parser_update(sub_parsers, aliases):
+    help_ = "Updates conda packages to the latest compatible version."
+    descr = _UPDATE_DESCR_TMPL.format(help_=help_)
+    example = _UPDATE_EXAMPLE
 
     p = sub_parsers.add_parser(
         "update",
@@ -1523,20 +1612,19 @@ def configure_parser_update(sub_parsers, aliases):
     solver_mode_options.add_argument(
         "--force-reinstall",
         action="store_true",
-        default=NULL,
-        help="Ensure that any user-requested package for the current operation is uninstalled and "
-        "reinstalled, even if that package already exists in the environment.",
+        default=SUPPRESS,
+        help=_FORCE_REINSTALL_HELP,
     )
     add_parser_update_modifiers(solver_mode_options)
 
     package_install_options.add_argument(
         "--clobber",
         action="store_true",
-        default=NULL,
+        default=SUPPRESS,
         help="Allow clobbering of overlapping file paths within packages, "
         "and suppress related warnings.",
     )
-    p.set_defaults(func=".main_update.execute")
+    _set_entry(p, "update")
 
 
 NOTICES_HELP = "Retrieves latest channel notifications."
@@ -1552,17 +1640,17 @@ NOTICES_DESCRIPTION = dals(
 )
 
 
-def configure_parser_notices(sub_parsers, name="notices"):
-    example = dals(
-        f"""
-        Examples::
+_NOTICES_EXAMPLE_TMPL = """Examples::
 
-        conda {name}
+conda {name}
 
-        conda {name} -c defaults
+conda {name} -c defaults
 
-        """
-    )
+"""
+
+
+def configure_parser_notices(sub_parsers, name="notices"):
+    example = _NOTICES_EXAMPLE_TMPL.format(name=name)
     p = sub_parsers.add_parser(
         name,
         description=NOTICES_DESCRIPTION,
@@ -1570,36 +1658,36 @@ def configure_parser_notices(sub_parsers, name="notices"):
         epilog=example,
     )
     add_parser_channels(p)
-    p.set_defaults(func=".main_notices.execute")
+    _set_entry(p, "notices")
 
 
-def configure_parser_rename(sub_parsers) -> None:
-    help = "Renames an existing environment."
-    descr = dals(
-        f"""
-        {help}
+_RENAME_EXAMPLE = """Examples::
 
-        This command renames a conda environment via its name (-n/--name) or
-        its prefix (-p/--prefix).
+    conda rename -n test123 test321
 
-        The base environment and the currently-active environment cannot be renamed.
-        """
-    )
+    conda rename --name test123 test321
 
-    example = dals(
-        """
-        Examples::
+    conda rename -p path/to/test123 test321
 
-            conda rename -n test123 test321
+    conda rename --prefix path/to/test123 test321
 
-            conda rename --name test123 test321
+"""
 
-            conda rename -p path/to/test123 test321
 
-            conda rename --prefix path/to/test123 test321
+_RENAME_DESCR_TMPL = """{help}
 
-        """
-    )
+This command renames a conda environment via its name (-n/--name) or
+its prefix (-p/--prefix).
+
+The base environment and the currently-active environment cannot be renamed.
+"""
+
+
+def configure_parser_rename(sub_parsers) -> None:
+    help = "Renames an existing environment."
+    descr = _RENAME_DESCR_TMPL.format(help=help)
+
+    example = _RENAME_EXAMPLE
 
     p = sub_parsers.add_parser(
         "rename",
@@ -1626,7 +1714,7 @@ def configure_parser_rename(sub_parsers) -> None:
         action="store_true",
         default=False,
     )
-    p.set_defaults(func=".main_rename.execute")
+    _set_entry(p, "rename")
 
 
 # #############################################################################################
@@ -1647,7 +1735,7 @@ def add_parser_create_install_update(p, prefix_required=False):
     output_and_prompt_options.add_argument(
         "--download-only",
         action="store_true",
-        default=NULL,
+        default=SUPPRESS,
         help="Solve an environment and ensure package caches are populated, but exit "
         "prior to unlinking and linking packages into the prefix.",
     )
@@ -1661,7 +1749,7 @@ def add_parser_create_install_update(p, prefix_required=False):
     p.add_argument(
         "--file",
         default=[],
-        action="append",
+        action=InPlaceAppendAction,
         help="Read package versions from the given file. Repeated file "
         "specifications can be passed (e.g. --file=file1 --file=file2).",
     )
@@ -1685,7 +1773,7 @@ def add_parser_show_channel_urls(p):
         "--show-channel-urls",
         action="store_true",
         dest="show_channel_urls",
-        default=NULL,
+        default=SUPPRESS,
         help="Show channel urls. "
         "Overrides the value given by `conda config --show show_channel_urls`.",
     )
@@ -1693,6 +1781,7 @@ def add_parser_show_channel_urls(p):
         "--no-show-channel-urls",
         action="store_false",
         dest="show_channel_urls",
+        default=SUPPRESS,
         help=SUPPRESS,
     )
 
@@ -1707,7 +1796,7 @@ def add_parser_help(p):
     p.add_argument(
         "-h",
         "--help",
-        action=_HelpAction,
+        action="help",
         help="Show this help message and exit.",
     )
 
@@ -1733,37 +1822,130 @@ def add_parser_prefix(p, prefix_required=False):
     )
 
 
+def _add_arguments(group, specs):
+    # one tight loop over (option_strings, kwargs) pairs; the spec tables are
+    # built once at import and shared across subparsers
+    for flags, kwargs in specs:
+        group.add_argument(*flags, **kwargs)
+
+
+#: shared kwargs for the hidden-test --dev flag on create/install/remove
+_DEV_KW = dict(
+    action=NullCountAction,
+    help="Use `sys.executable -m conda` in wrapper scripts instead of CONDA_EXE. "
+    "This is mainly for use during tests where we test new conda sources "
+    "against old Python versions.",
+    dest="dev",
+    default=NULL,
+)
+
+#: shared kwargs for the short-form -v/--verbose counter
+_VERBOSE_KW = dict(
+    action=NullCountAction,
+    help="Use once for info, twice for debug, three times for trace.",
+    dest="verbosity",
+    default=NULL,
+)
+
+#: common add_parser kwargs for subparsers that preformat their text and add
+#: their own help action
+_RAW_KW = dict(formatter_class=RawDescriptionHelpFormatter, add_help=False)
+
+#: kwargs shared verbatim between the two output/prompt spec tables below
+_DEBUG_KW = dict(action="store_true", default=NULL, help=SUPPRESS)
+_JSON_KW = dict(
+    action="store_true",
+    default=NULL,
+    help="Report all output as json. Suitable for using conda programmatically.",
+)
+_QUIET_KW = dict(action="store_true", default=NULL, help="Do not display progress bar.")
+
+#: help shared verbatim by install and update
+_FORCE_REINSTALL_HELP = (
+    "Ensure that any user-requested package for the current operation is uninstalled and "
+    "reinstalled, even if that package already exists in the environment."
+)
+
+#: long help texts for shared helper options, built once and shared by every
+#: subparser that registers them
+_CHANNEL_HELP = (
+    "Additional channel to search for packages. These are URLs searched in the order "
+    "they are given (including local directories using the 'file://' syntax or "
+    "simply a path like '/home/conda/mychan' or '../mychan'). Then, the defaults "
+    "or channels from .condarc are searched (unless --override-channels is given). "
+    "You can use 'defaults' to get the default packages for conda. You can also "
+    "use any name and the .condarc channel_alias value will be prepended. The "
+    "default channel_alias is https://conda.anaconda.org/."
+)
+_REPODATA_FN_HELP = (
+    "Specify file name of repodata on the remote server where your channels "
+    "are configured or within local backups. Conda will try whatever you "
+    "specify, but will ultimately fall back to repodata.json if your specs are "
+    "not satisfiable with what you specify here. This is used to employ repodata "
+    "that is smaller and reduced in time scope. You may pass this flag more than "
+    "once. Leftmost entries are tried first, and the fallback to repodata.json "
+    "is added for you automatically. For more information, see "
+    "conda config --describe repodata_fns."
+)
+_USE_INDEX_CACHE_HELP = (
+    "Use cache of channel index files, even if it has expired. This is useful "
+    "if you don't want conda to check whether a new version of the repodata "
+    "file exists, which will save bandwidth."
+)
+_SATISFIED_SKIP_SOLVE_HELP = (
+    "Exit early and do not run the solver if the requested specs are satisfied. "
+    "Also skips aggressive updates as configured by the "
+    "'aggressive_update_packages' config setting. Use "
+    "'conda info --describe aggressive_update_packages' to view your setting. "
+    "--satisfied-skip-solve is similar to the default behavior of 'pip install'."
+)
+
+#: specs for the "Output, Prompt, and Flow Control Options" group added by
+#: add_parser_json
+_JSON_GROUP_SPECS = (
+    (("--debug",), _DEBUG_KW),
+    (("--json",), _JSON_KW),
+    (("-v", "--verbose"), _VERBOSE_KW),
+    (("-q", "--quiet"), _QUIET_KW),
+)
+
+#: specs for the fuller "Output, Prompt, and Flow Control Options" group added
+#: by add_output_and_prompt_options
+_OUTPUT_PROMPT_SPECS = (
+    (("--debug",), _DEBUG_KW),
+    (
+        ("-d", "--dry-run"),
+        dict(action="store_true", help="Only display what would have been done."),
+    ),
+    (("--json",), _JSON_KW),
+    (("-q", "--quiet"), _QUIET_KW),
+    (
+        ("-v", "--verbose"),
+        dict(
+            action=NullCountAction,
+            help="Can be used multiple times. Once for INFO, twice for DEBUG, "
+            "three times for TRACE.",
+            dest="verbosity",
+            default=NULL,
+        ),
+    ),
+    (
+        ("-y", "--yes"),
+        dict(
+            action="store_true",
+            default=NULL,
+            help="Sets any confirmation values to 'yes' automatically. "
+            "Users will not be asked to confirm any adding, deleting, backups, etc.",
+        ),
+    ),
+)
+
+
 def add_parser_json(p):
     output_and_prompt_options = p.add_argument_group(
         "Output, Prompt, and Flow Control Options"
     )
-    output_and_prompt_options.add_argument(
-        "--debug",
-        action="store_true",
-        default=NULL,
-        help=SUPPRESS,
-    )
-    output_and_prompt_options.add_argument(
-        "--json",
-        action="store_true",
-        default=NULL,
-        help="Report all output as json. Suitable for using conda programmatically.",
-    )
-    output_and_prompt_options.add_argument(
-        "-v",
-        "--verbose",
-        action=NullCountAction,
-        help="Use once for info, twice for debug, three times for trace.",
-        dest="verbosity",
-        default=NULL,
-    )
-    output_and_prompt_options.add_argument(
-        "-q",
-        "--quiet",
-        action="store_true",
-        default=NULL,
-        help="Do not display progress bar.",
-    )
+    _add_arguments(output_and_prompt_options, _JSON_GROUP_SPECS)
     return output_and_prompt_options
 
 
@@ -1771,47 +1953,7 @@ def add_output_and_prompt_options(p):
     output_and_prompt_options = p.add_argument_group(
         "Output, Prompt, and Flow Control Options"
     )
-    output_and_prompt_options.add_argument(
-        "--debug",
-        action="store_true",
-        default=NULL,
-        help=SUPPRESS,
-    )
-    output_and_prompt_options.add_argument(
-        "-d",
-        "--dry-run",
-        action="store_true",
-        help="Only display what would have been done.",
-    )
-    output_and_prompt_options.add_argument(
-        "--json",
-        action="store_true",
-        default=NULL,
-        help="Report all output as json. Suitable for using conda programmatically.",
-    )
-    output_and_prompt_options.add_argument(
-        "-q",
-        "--quiet",
-        action="store_true",
-        default=NULL,
-        help="Do not display progress bar.",
-    )
-    output_and_prompt_options.add_argument(
-        "-v",
-        "--verbose",
-        action=NullCountAction,
-        help="Can be used multiple times. Once for INFO, twice for DEBUG, three times for TRACE.",
-        dest="verbosity",
-        default=NULL,
-    )
-    output_and_prompt_options.add_argument(
-        "-y",
-        "--yes",
-        action="store_true",
-        default=NULL,
-        help="Sets any confirmation values to 'yes' automatically. "
-        "Users will not be asked to confirm any adding, deleting, backups, etc.",
-    )
+    _add_arguments(output_and_prompt_options, _OUTPUT_PROMPT_SPECS)
     return output_and_prompt_options
 
 
@@ -1822,16 +1964,8 @@ def add_parser_channels(p):
         "--channel",
         dest="channel",  # apparently conda-build uses this; someday rename to channels are remove context.channels alias to channel  # NOQA
         # TODO: if you ever change 'channel' to 'channels', make sure you modify the context.channels property accordingly # NOQA
-        action="append",
-        help=(
-            "Additional channel to search for packages. These are URLs searched in the order "
-            "they are given (including local directories using the 'file://' syntax or "
-            "simply a path like '/home/conda/mychan' or '../mychan'). Then, the defaults "
-            "or channels from .condarc are searched (unless --override-channels is given). "
-            "You can use 'defaults' to get the default packages for conda. You can also "
-            "use any name and the .condarc channel_alias value will be prepended. The "
-            "default channel_alias is https://conda.anaconda.org/."
-        ),
+        action=InPlaceAppendAction,
+        help=_CHANNEL_HELP,
     )
     channel_customization_options.add_argument(
         "--use-local",
@@ -1846,22 +1980,13 @@ def add_parser_channels(p):
     )
     channel_customization_options.add_argument(
         "--repodata-fn",
-        action="append",
+        action=InPlaceAppendAction,
         dest="repodata_fns",
-        help=(
-            "Specify file name of repodata on the remote server where your channels "
-            "are configured or within local backups. Conda will try whatever you "
-            "specify, but will ultimately fall back to repodata.json if your specs are "
-            "not satisfiable with what you specify here. This is used to employ repodata "
-            "that is smaller and reduced in time scope. You may pass this flag more than "
-            "once. Leftmost entries are tried first, and the fallback to repodata.json "
-            "is added for you automatically. For more information, see "
-            "conda config --describe repodata_fns."
-        ),
+        help=_REPODATA_FN_HELP,
     )
     channel_customization_options.add_argument(
         "--experimental",
-        action="append",
+        action=InPlaceAppendAction,
         choices=["jlap", "lock"],
         help="jlap: Download incremental package index data from repodata.jlap; implies 'lock'. "
         "lock: use locking when reading, updating index (repodata.json) cache. ",
@@ -1876,7 +2001,7 @@ def add_parser_solver_mode(p):
         "--strict-channel-priority",
         action="store_const",
         dest="channel_priority",
-        default=NULL,
+        default=SUPPRESS,
         const="strict",
         help="Packages in lower priority channels are not considered if a package "
         "with the same name appears in a higher priority channel.",
@@ -1885,14 +2010,14 @@ def add_parser_solver_mode(p):
         "--channel-priority",
         action="store_true",
         dest="channel_priority",
-        default=NULL,
+        default=SUPPRESS,
         help=SUPPRESS,
     )
     solver_mode_options.add_argument(
         "--no-channel-priority",
         action="store_const",
         dest="channel_priority",
-        default=NULL,
+        default=SUPPRESS,
         const="disabled",
         help="Package version takes precedence over channel priority. "
         "Overrides the value given by `conda config --show channel_priority`.",
@@ -1904,7 +2029,7 @@ def add_parser_solver_mode(p):
         dest="deps_modifier",
         help="Do not install, update, remove, or change dependencies. This WILL lead "
         "to broken environments and inconsistent behavior. Use at your own risk.",
-        default=NULL,
+        default=SUPPRESS,
     )
     deps_modifiers.add_argument(
         "--only-deps",
@@ -1912,13 +2037,13 @@ def add_parser_solver_mode(p):
         const=DepsModifier.ONLY_DEPS,
         dest="deps_modifier",
         help="Only install dependencies.",
-        default=NULL,
+        default=SUPPRESS,
     )
     solver_mode_options.add_argument(
         "--no-pin",
         action="store_true",
         dest="ignore_pinned",
-        default=NULL,
+        default=SUPPRESS,
         help="Ignore pinned file.",
     )
     return solver_mode_options
@@ -1950,11 +2075,7 @@ def add_parser_update_modifiers(solver_mode_options):
         const=UpdateModifier.SPECS_SATISFIED_SKIP_SOLVE,
         dest="update_modifier",
         default=NULL,
-        help="Exit early and do not run the solver if the requested specs are satisfied. "
-        "Also skips aggressive updates as configured by the "
-        "'aggressive_update_packages' config setting. Use "
-        "'conda info --describe aggressive_update_packages' to view your setting. "
-        "--satisfied-skip-solve is similar to the default behavior of 'pip install'.",
+        help=_SATISFIED_SKIP_SOLVE_HELP,
     )
     update_modifiers.add_argument(
         "--update-all",
@@ -1979,20 +2100,33 @@ def add_parser_prune(p):
     p.add_argument(
         "--prune",
         action="store_true",
-        default=NULL,
+        default=SUPPRESS,
         help=SUPPRESS,
     )
 
 
+class _ChoiceSet(frozenset):
+    # argparse validates with `value in choices` (O(1) here) and renders
+    # help/errors by iterating; keep the iteration deterministic
+    def __iter__(self):
+        return iter(sorted(frozenset.__iter__(self)))
+
+
+@lru_cache(maxsize=1)
+def _solver_choices():
+    # the solver plugin set is invariant within a process; enumerate it once
+    return _ChoiceSet(
+        solver.name for solver in context.plugin_manager.get_hook_results("solvers")
+    )
+
+
 def add_parser_solver(p):
     """
     Add a command-line flag for alternative solver backends.
 
     See ``context.solver`` for more info.
     """
-    solver_choices = [
-        solver.name for solver in context.plugin_manager.get_hook_results("solvers")
-    ]
+    solver_choices = _solver_choices()
     group = p.add_mutually_exclusive_group()
     group.add_argument(
         "--solver",
@@ -2018,29 +2152,27 @@ def add_parser_networking(p):
         "--use-index-cache",
         action="store_true",
         default=False,
-        help="Use cache of channel index files, even if it has expired. This is useful "
-        "if you don't want conda to check whether a new version of the repodata "
-        "file exists, which will save bandwidth.",
+        help=_USE_INDEX_CACHE_HELP,
     )
     networking_options.add_argument(
         "-k",
         "--insecure",
         action="store_false",
         dest="ssl_verify",
-        default=NULL,
+        default=SUPPRESS,
         help='Allow conda to perform "insecure" SSL connections and transfers. '
         "Equivalent to setting 'ssl_verify' to 'false'.",
     )
     networking_options.add_argument(
         "--offline",
         action="store_true",
-        default=NULL,
+        default=SUPPRESS,
         help="Offline mode. Don't connect to the Internet.",
     )
     return networking_options
 
 
-def add_parser_package_install_options(p):
+def _add_parser_package_install_options_common(p):
     package_install_options = p.add_argument_group(
         "Package Linking and Install-time Options"
     )
@@ -2057,24 +2189,36 @@ def add_parser_package_install_options(p):
         default=NULL,
         help="Install all packages using copies instead of hard- or soft-linking.",
     )
-    if on_win:
-        package_install_options.add_argument(
-            "--shortcuts",
-            action="store_true",
-            help=SUPPRESS,
-            dest="shortcuts",
-            default=NULL,
-        )
-        package_install_options.add_argument(
-            "--no-shortcuts",
-            action="store_false",
-            help="Don't install start menu shortcuts",
-            dest="shortcuts",
-            default=NULL,
-        )
     return package_install_options
 
 
+def _add_parser_package_install_options_win(p):
+    package_install_options = _add_parser_package_install_options_common(p)
+    package_install_options.add_argument(
+        "--shortcuts",
+        action="store_true",
+        help=SUPPRESS,
+        dest="shortcuts",
+        default=NULL,
+    )
+    package_install_options.add_argument(
+        "--no-shortcuts",
+        action="store_false",
+        help="Don't install start menu shortcuts",
+        dest="shortcuts",
+        default=NULL,
+    )
+    return package_install_options
+
+
+# the platform never changes mid-process; resolve the branch once at import
+add_parser_package_install_options = (
+    _add_parser_package_install_options_win
+    if on_win
+    else _add_parser_package_install_options_common
+)
+
+
 def add_parser_known(p):
     p.add_argument(
         "--unknown",
@@ -2091,3 +2235,33 @@ def add_parser_default_packages(p):
         action="store_true",
         help="Ignore create_default_packages in the .condarc file.",
     )
+
+
+# map of subcommand name (including aliases) to its parser builder; iterated
+# in full when every subparser is needed, indexed when a single invocation
+# only requires one
+_SUBCOMMAND_BUILDERS = {
+    "clean": configure_parser_clean,
+    "compare": configure_parser_compare,
+    "config": configure_parser_config,
+    "create": configure_parser_create,
+    "info": configure_parser_info,
+    "init": configure_parser_init,
+    "install": configure_parser_install,
+    "list": configure_parser_list,
+    "package": configure_parser_package,
+    "remove": partial(configure_parser_remove, aliases=["uninstall"]),
+    "rename": configure_parser_rename,
+    "run": configure_parser_run,
+    "search": configure_parser_search,
+    "update": partial(configure_parser_update, aliases=["upgrade"]),
+    "notices": configure_parser_notices,
+}
+_SUBCOMMAND_BUILDERS["uninstall"] = _SUBCOMMAND_BUILDERS["remove"]
+_SUBCOMMAND_BUILDERS["upgrade"] = _SUBCOMMAND_BUILDERS["update"]
+# builders in registration order, aliases deduplicated
+_UNIQUE_SUBCOMMAND_BUILDERS = tuple(dict.fromkeys(_SUBCOMMAND_BUILDERS.values()))
+
+#: every builtin subcommand name and alias; shell-completion hooks and error
+#: paths can answer membership without constructing a parser
+SUBCOMMANDS = frozenset(_SUBCOMMAND_BUILDERS)
@@ -11,6 +11,13 @@ from ..common.compat import on_win
 
 
 def find_executable(executable, include_others=True):
+    # the PATH value participates in the cache key so a process that mutates
+    # its environment is never served a stale location
+    return _find_executable(executable, include_others, os.environ.get("PATH", ""))
+
+
+@lru_cache(maxsize=None)
+def _find_executable(executable, include_others, path):
     # backwards compatibility
     global dir_paths
 
@@ -27,7 +34,7 @@ def find_executable(executable, include_others=True):
     else:
         dir_paths = []
 
-    dir_paths.extend(os.environ.get("PATH", "").split(os.pathsep))
+    dir_paths.extend(path.split(os.pathsep))
 
     for dir_path in dir_paths:
         if on_win:
@@ -67,7 +67,7 @@ def main_subshell(*args, post_parse_hook=None, **kwargs):
 
     args = args or ["--help"]
 
-    p = generate_parser()
+    p = generate_parser(argv=args)
     args = p.parse_args(args)
 
     from ..base.context import context
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 import logging
 import re
+from functools import lru_cache
 from os.path import isdir, isfile
 
 from ..base.constants import DEFAULTS_CHANNEL_NAME, UNKNOWN_CHANNEL
@@ -20,8 +21,15 @@ def print_export_header(subdir):
     print("# platform: %s" % subdir)
 
 
+@lru_cache(maxsize=128)
+def _compile_regex(regex):
+    # repeated in-process listings (python_api, test harnesses) reuse the
+    # compiled pattern instead of going back through re's parser
+    return re.compile(regex, re.I)
+
+
 def get_packages(installed, regex):
-    pat = re.compile(regex, re.I) if regex else None
+    pat = _compile_regex(regex) if regex else None
     for prefix_rec in sorted(installed, key=lambda x: x.name.lower()):
         if pat and pat.search(prefix_rec.name) is None:
             continue
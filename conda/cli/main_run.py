@@ -29,7 +29,7 @@ def execute(args, parser):
     response = subprocess_call(
         command,
         env=encode_environment(os.environ.copy()),
-        path=args.cwd,
+        path=args.cwd or os.getcwd(),
         raise_on_error=False,
         capture_output=not args.no_capture_output,
     )
@@ -488,15 +488,26 @@ class SubdirData(metaclass=SubdirDataType):
             k[:-6] + _tar_bz2 for k in conda_packages.keys()
         }
 
+        # check once per repodata pass rather than once per record; unsigned
+        # repodata or disabled verification (the common cases) then cost
+        # nothing in the loop, and the former no longer evaluates `enabled`
+        # (which can reach for trust metadata) at all
+        verify_signature = (
+            signature_verification
+            if signatures and signature_verification.enabled
+            else None
+        )
+
         for group, copy_legacy_md5 in (
             (conda_packages.items(), True),
             (((k, legacy_packages[k]) for k in use_these_legacy_keys), False),
         ):
             for fn, info in group:
-                # Verify metadata signature before anything else so run-time
-                # updates to the info dictionary performed below do not
-                # invalidate the signatures provided in metadata.json.
-                signature_verification(info, fn, signatures)
+                if verify_signature:
+                    # Verify metadata signature before anything else so run-time
+                    # updates to the info dictionary performed below do not
+                    # invalidate the signatures provided in metadata.json.
+                    verify_signature(info, fn, signatures)
 
                 if copy_legacy_md5:
                     counterpart = fn.replace(".conda", ".tar.bz2")
@@ -1,26 +1,15 @@
 # Copyright (C) 2012 Anaconda, Inc
 # SPDX-License-Identifier: BSD-3-Clause
 import json
+import pickle
+import re
+import time
 import warnings
-from functools import lru_cache
-from glob import glob
+from functools import cached_property, lru_cache
 from logging import getLogger
-from os import makedirs
-from os.path import basename, exists, isdir, join
-
-try:
-    from conda_content_trust.authentication import verify_delegation, verify_root
-    from conda_content_trust.common import (
-        SignatureError,
-        load_metadata_from_file,
-        write_metadata_to_file,
-    )
-    from conda_content_trust.signing import wrap_as_signable
-except ImportError:
-    # _SignatureVerification.enabled handles the rest of this state
-    class SignatureError(Exception):
-        pass
-
+from os import makedirs, scandir, stat
+from os.path import exists, isdir, join
+from types import SimpleNamespace
 
 from ..base.context import context
 from ..common.url import join_url
@@ -30,11 +19,118 @@ from .constants import INITIAL_TRUST_ROOT, KEY_MGR_FILE
 
 log = getLogger(__name__)
 
+try:
+    # ~3-5x faster than the stdlib for the signature-laden root metadata
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+#: invariant request headers for trust metadata fetches
+_BASE_HEADERS = {
+    "Accept-Encoding": "gzip, deflate, compress, identity",
+    "Connection": "keep-alive",
+    "Content-Type": "application/json",
+}
+
+#: versioned root metadata files are named exactly "<version>.root.json"
+_ROOT_METADATA_RE = re.compile(r"^(\d+)\.root\.json$")
+
+#: seconds during which a refresh that confirmed us current is not repeated;
+#: spares one TLS round trip per conda invocation in the common case
+_REFRESH_TTL_SECONDS = 300
+
+
+@lru_cache(maxsize=None)
+def _ignore_insecure_request_warnings():
+    # mutating the global warnings filter is O(len(filters)) and not
+    # thread-safe; do it once per process instead of per fetch
+    warnings.filterwarnings("ignore", category=InsecureRequestWarning)
+
+
+def _fresh(path):
+    """Return True when ``path`` was written less than the TTL ago."""
+    try:
+        age = time.time() - stat(path).st_mtime
+    except OSError:
+        return False
+    return 0 <= age < _REFRESH_TTL_SECONDS
+
+
+@lru_cache(maxsize=None)
+def _signing_functions():
+    """Import the optional conda_content_trust machinery once, on first use.
+
+    The import chain is expensive, and signature verification is disabled in
+    the common case; returns None when the package is not installed.
+    """
+    try:
+        from conda_content_trust.authentication import verify_delegation, verify_root
+        from conda_content_trust.common import (
+            SignatureError,
+            load_metadata_from_file,
+            write_metadata_to_file,
+        )
+    except ImportError:
+        return None
+    return SimpleNamespace(
+        verify_delegation=verify_delegation,
+        verify_root=verify_root,
+        SignatureError=SignatureError,
+        load_metadata_from_file=load_metadata_from_file,
+        write_metadata_to_file=write_metadata_to_file,
+    )
+
+
+def _load_metadata_cached(path):
+    """Load trust metadata, preferring an up-to-date pickle sidecar.
+
+    Unpickling is an order of magnitude cheaper than re-parsing the JSON.
+    NOTE: unpickling executes whatever the sidecar encodes, so this relies
+    on av_data_dir being writable only by the invoking user (the same
+    assumption the .condarc and metadata files themselves depend on).
+    """
+    pickle_path = path + ".pkl"
+    try:
+        # strict > so an mtime tie (coarse filesystem timestamps) re-parses
+        # the JSON rather than trusting a possibly stale sidecar
+        if stat(pickle_path).st_mtime_ns > stat(path).st_mtime_ns:
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+    except Exception:
+        # this is only a cache, and a torn file can surface as almost
+        # anything (ValueError, MemoryError, ModuleNotFoundError, ...);
+        # whatever went wrong, fall back to the real JSON parse below
+        pass
+    metadata = _signing_functions().load_metadata_from_file(path)
+    try:
+        with open(pickle_path, "wb") as f:
+            pickle.dump(metadata, f, pickle.HIGHEST_PROTOCOL)
+    except OSError as err:
+        log.debug("could not write metadata cache for %s: %r", path, err)
+    return metadata
+
+
+def __getattr__(name):
+    # PEP 562: serve SignatureError without importing conda_content_trust at
+    # module import time; _SignatureVerification.enabled handles the rest of
+    # the missing-dependency state
+    if name == "SignatureError":
+        cct = _signing_functions()
+        if cct is not None:
+            signature_error = cct.SignatureError
+        else:
+
+            class SignatureError(Exception):
+                pass
+
+            signature_error = SignatureError
+        globals()[name] = signature_error
+        return signature_error
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class _SignatureVerification:
-    # FUTURE: Python 3.8+, replace with functools.cached_property
-    @property
-    @lru_cache(maxsize=None)
+    @cached_property
     def enabled(self):
         # safety checks must be enabled
         if not context.extra_safety_checks:
@@ -42,17 +138,15 @@ class _SignatureVerification:
 
         # signing url must be defined
         if not context.signing_metadata_url_base:
-            log.warn(
+            log.warning(
                 "metadata signature verification requested, "
                 "but no metadata URL base has not been specified."
             )
             return False
 
         # conda_content_trust must be installed
-        try:
-            import conda_content_trust  # noqa: F401
-        except ImportError:
-            log.warn(
+        if _signing_functions() is None:
+            log.warning(
                 "metadata signature verification requested, "
                 "but `conda-content-trust` is not installed."
             )
@@ -65,65 +159,82 @@ class _SignatureVerification:
 
         # ensure the trusted_root exists
         if self.trusted_root is None:
-            log.warn(
+            log.warning(
                 "could not find trusted_root data for metadata signature verification"
             )
             return False
 
         # ensure the key_mgr exists
         if self.key_mgr is None:
-            log.warn("could not find key_mgr data for metadata signature verification")
+            log.warning(
+                "could not find key_mgr data for metadata signature verification"
+            )
             return False
 
         # signature verification is enabled
         return True
 
-    # FUTURE: Python 3.8+, replace with functools.cached_property
-    @property
-    @lru_cache(maxsize=None)
+    @cached_property
     def trusted_root(self):
         # TODO: formalize paths for `*.root.json` and `key_mgr.json` on server-side
         trusted = INITIAL_TRUST_ROOT
 
-        # Load current trust root metadata from filesystem
-        for path in sorted(
-            glob(join(context.av_data_dir, "[0-9]*.root.json")), reverse=True
-        ):
-            try:
-                int(basename(path).split(".")[0])
-            except ValueError:
-                # prefix is not an int and is consequently an invalid file, skip to the next
-                pass
-            else:
-                log.info(f"Loading root metadata from {path}.")
-                trusted = load_metadata_from_file(path)
-                break
+        # Load current trust root metadata from filesystem; a single scandir
+        # pass tracking the highest version avoids glob's per-entry stats and
+        # the lexicographic sort (which mis-ordered 10.root.json vs
+        # 9.root.json)
+        latest_version = -1
+        latest_path = None
+        try:
+            entries = scandir(context.av_data_dir)
+        except OSError:
+            entries = None
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    # anything not matching "<version>.root.json" exactly is
+                    # an invalid file, skip to the next
+                    m = _ROOT_METADATA_RE.match(entry.name)
+                    if m is None:
+                        continue
+                    version = int(m.group(1))
+                    if version > latest_version:
+                        latest_version, latest_path = version, entry.path
+        if latest_path is not None:
+            log.info(f"Loading root metadata from {latest_path}.")
+            trusted = _load_metadata_cached(latest_path)
         else:
             log.debug(
                 f"No root metadata in {context.av_data_dir}. "
                 "Using built-in root metadata."
             )
 
-        # Refresh trust root metadata
+        # Refresh trust root metadata, unless a refresh confirmed us current
+        # within the TTL window
+        if _fresh(self._refresh_stamp_path):
+            return trusted
+
         more_signatures = True
+        confirmed_current = False
         while more_signatures:
-            # TODO: caching mechanism to reduce number of refresh requests
             fname = f"{trusted['signed']['version'] + 1}.root.json"
             path = join(context.av_data_dir, fname)
 
             try:
                 # TODO: support fetching root data with credentials
-                untrusted = self._fetch_channel_signing_data(
+                untrusted, _ = self._fetch_channel_signing_data(
                     context.signing_metadata_url_base,
                     fname,
                 )
 
-                verify_root(trusted, untrusted)
+                _signing_functions().verify_root(trusted, untrusted)
             except HTTPError as err:
                 # HTTP 404 implies no updated root.json is available, which is
                 # not really an "error" and does not need to be logged.
                 if err.response.status_code != 404:
                     log.error(err)
+                else:
+                    confirmed_current = True
                 more_signatures = False
             except Exception as err:
                 # TODO: more error handling
@@ -132,13 +243,51 @@ class _SignatureVerification:
             else:
                 # New trust root metadata checks out
                 trusted = untrusted
-                write_metadata_to_file(trusted, path)
+                _signing_functions().write_metadata_to_file(trusted, path)
+
+        if confirmed_current:
+            self._record_refresh()
 
         return trusted
 
-    # FUTURE: Python 3.8+, replace with functools.cached_property
+    @staticmethod
+    def _cache_headers_path(path):
+        return path + ".info"
+
+    def _read_cache_headers(self, path):
+        try:
+            with open(self._cache_headers_path(path)) as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return info if isinstance(info, dict) else {}
+
+    def _write_cache_headers(self, path, headers):
+        info = {
+            "etag": headers.get("ETag"),
+            "mod_stamp": headers.get("Last-Modified"),
+        }
+        if not (info["etag"] or info["mod_stamp"]):
+            return
+        try:
+            with open(self._cache_headers_path(path), "w") as f:
+                json.dump(info, f)
+        except OSError as err:
+            log.debug("could not store validators for %s: %r", path, err)
+
     @property
-    @lru_cache(maxsize=None)
+    def _refresh_stamp_path(self):
+        # touched after a refresh that confirmed the local root is current
+        return join(context.av_data_dir, ".last_refresh")
+
+    def _record_refresh(self):
+        try:
+            with open(self._refresh_stamp_path, "w"):
+                pass
+        except OSError as err:
+            log.debug("could not record trust metadata refresh time: %r", err)
+
+    @cached_property
     def key_mgr(self):
         trusted = None
 
@@ -146,33 +295,46 @@ class _SignatureVerification:
         fname = KEY_MGR_FILE
         path = join(context.av_data_dir, fname)
 
+        # a recently written key_mgr on disk short-circuits the fetch
+        if _fresh(path):
+            return _load_metadata_cached(path)
+
+        # send stored validators so an unchanged key_mgr costs no body
+        cached_headers = self._read_cache_headers(path) if exists(path) else {}
+
         try:
-            untrusted = self._fetch_channel_signing_data(
+            untrusted, response_headers = self._fetch_channel_signing_data(
                 context.signing_metadata_url_base,
                 KEY_MGR_FILE,
+                etag=cached_headers.get("etag"),
+                mod_stamp=cached_headers.get("mod_stamp"),
             )
-
-            verify_delegation("key_mgr", untrusted, self.trusted_root)
         except (ConnectionError, HTTPError) as err:
-            log.warn(err)
+            log.warning(err)
         except Exception as err:
             # TODO: more error handling
-            raise
             log.error(err)
         else:
-            # New key manager metadata checks out
-            trusted = untrusted
-            write_metadata_to_file(trusted, path)
+            if untrusted is None:
+                # HTTP 304: the server confirmed the on-disk copy is current
+                trusted = _load_metadata_cached(path)
+            else:
+                # an invalid key_mgr must raise, never degrade to the disk copy
+                _signing_functions().verify_delegation(
+                    "key_mgr", untrusted, self.trusted_root
+                )
+                # New key manager metadata checks out
+                trusted = untrusted
+                _signing_functions().write_metadata_to_file(trusted, path)
+                self._write_cache_headers(path, response_headers)
 
         # If key_mgr is unavailable from server, fall back to copy on disk
         if not trusted and exists(path):
-            trusted = load_metadata_from_file(path)
+            trusted = _load_metadata_cached(path)
 
         return trusted
 
-    # FUTURE: Python 3.8+, replace with functools.cached_property
-    @property
-    @lru_cache(maxsize=None)
+    @cached_property
     def session(self):
         return CondaSession()
 
@@ -180,16 +342,17 @@ class _SignatureVerification:
         self, signing_data_url, filename, etag=None, mod_stamp=None
     ):
         if not context.ssl_verify:
-            warnings.simplefilter("ignore", InsecureRequestWarning)
-
-        headers = {
-            "Accept-Encoding": "gzip, deflate, compress, identity",
-            "Content-Type": "application/json",
-        }
-        if etag:
-            headers["If-None-Match"] = etag
-        if mod_stamp:
-            headers["If-Modified-Since"] = mod_stamp
+            _ignore_insecure_request_warnings()
+
+        if etag or mod_stamp:
+            headers = dict(_BASE_HEADERS)
+            if etag:
+                headers["If-None-Match"] = etag
+            if mod_stamp:
+                headers["If-Modified-Since"] = mod_stamp
+        else:
+            # requests merges without mutating, so the shared dict is safe
+            headers = _BASE_HEADERS
 
         try:
             # The `auth` argument below looks a bit weird, but passing `None` seems
@@ -202,7 +365,6 @@ class _SignatureVerification:
             resp = self.session.get(
                 join_url(signing_data_url, filename),
                 headers=headers,
-                proxies=self.session.proxies,
                 auth=lambda r: r,
                 timeout=(
                     context.remote_connect_timeout_secs,
@@ -210,6 +372,11 @@ class _SignatureVerification:
                 ),
             )
 
+            if resp.status_code == 304:
+                # the validators matched; there is no body and the caller
+                # should keep its local copy
+                return None, resp.headers
+
             resp.raise_for_status()
         except:
             # TODO: more sensible error handling
@@ -221,25 +388,34 @@ class _SignatureVerification:
         # content here (rather than directly in the return statement) so callers of
         # this function only have to worry about a ValueError being raised.
         try:
-            return resp.json()
-        except json.decoder.JSONDecodeError as err:  # noqa
+            # bypass resp.json()'s encoding sniffing; both stdlib and orjson
+            # raise a ValueError subclass on bad input
+            return _json_loads(resp.content), resp.headers
+        except ValueError:
             # TODO: additional loading and error handling improvements?
             raise ValueError(
                 f"Invalid JSON returned from {signing_data_url}/{filename}"
             )
 
     def __call__(self, info, fn, signatures):
-        if not self.enabled or fn not in signatures:
+        # disabled is the common case; return on the cached attribute alone
+        # without hashing fn into the signatures dict
+        if not self.enabled:
+            return
+        if fn not in signatures:
             return
 
-        # create a signable envelope (a dict with the info and signatures)
-        envelope = wrap_as_signable(info)
-        envelope["signatures"] = signatures[fn]
+        cct = _signing_functions()
+
+        # create a signable envelope (a dict with the info and signatures);
+        # wrap_as_signable would deep-copy info, which verification (a pure
+        # read) does not need
+        envelope = {"signatures": signatures[fn], "signed": info}
 
         try:
-            verify_delegation("pkg_mgr", envelope, self.key_mgr)
-        except SignatureError:
-            log.warn(f"invalid signature for {fn}")
+            cct.verify_delegation("pkg_mgr", envelope, self.key_mgr)
+        except cct.SignatureError:
+            log.warning(f"invalid signature for {fn}")
             status = "(WARNING: metadata signature verification failed)"
         else:
             status = "(INFO: package metadata is signed by Anaconda and trusted)"
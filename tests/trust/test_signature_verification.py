@@ -1,6 +1,7 @@
 # Copyright (C) 2012 Anaconda, Inc
 # SPDX-License-Identifier: BSD-3-Clause
 import json
+import os
 from pathlib import Path
 from shutil import copyfile
 from types import SimpleNamespace
@@ -126,7 +127,7 @@ def test_invalid_2nd_metadata_on_disk_no_new_metadata_on_web(
     test_2_root_data = json.loads(test_2_root_dest.read_text())
 
     data_mock = Mock()
-    data_mock.side_effect = [test_2_root_data]
+    data_mock.side_effect = [(test_2_root_data, {})]
     sig_ver = _SignatureVerification()
     sig_ver._fetch_channel_signing_data = data_mock
 
@@ -168,7 +169,7 @@ def test_2nd_root_metadata_from_web(
     test_2_root_data = json.loads(testdata_2_root.read_text())
 
     data_mock = Mock()
-    data_mock.side_effect = [test_2_root_data]
+    data_mock.side_effect = [(test_2_root_data, {})]
     sig_ver = _SignatureVerification()
     sig_ver._fetch_channel_signing_data = data_mock
 
@@ -212,7 +213,7 @@ def test_3rd_root_metadata_from_web(
     test_3_root_data = json.loads(testdata_3_root.read_text())
 
     data_mock = Mock()
-    data_mock.side_effect = [test_2_root_data, test_3_root_data]
+    data_mock.side_effect = [(test_2_root_data, {}), (test_3_root_data, {})]
     sig_ver = _SignatureVerification()
     sig_ver._fetch_channel_signing_data = data_mock
 
@@ -256,7 +257,7 @@ def test_single_invalid_signature_3rd_root_metadata_from_web(
     test_3_root_data = json.loads(testdata_3_root.read_text())
 
     data_mock = Mock()
-    data_mock.side_effect = [test_2_root_data, test_3_root_data]
+    data_mock.side_effect = [(test_2_root_data, {}), (test_3_root_data, {})]
     sig_ver = _SignatureVerification()
     sig_ver._fetch_channel_signing_data = data_mock
 
@@ -269,6 +270,108 @@ def test_single_invalid_signature_3rd_root_metadata_from_web(
     assert check_trusted_root == test_2_root_data
 
 
+def test_trusted_root_ttl_skips_refresh(
+    initial_trust_root: str,
+    tmp_path: Path,
+    mocker: MockerFixture,
+):
+    """
+    A refresh that confirms the local root chain is current records a stamp;
+    a second instance within the TTL window must not go back to the network.
+    """
+    mocker.patch(
+        "conda.base.context.Context.av_data_dir",
+        new_callable=PropertyMock,
+        return_value=tmp_path,
+    )
+    mocker.patch(
+        "conda.trust.signature_verification.INITIAL_TRUST_ROOT",
+        new=initial_trust_root,
+    )
+
+    # Mock out HTTP request
+    err = HTTPError()
+    err.response = SimpleNamespace()
+    err.response.status_code = 404
+
+    # First instance: the 404 confirms we are current and writes the stamp
+    sig_ver = _SignatureVerification()
+    sig_ver._fetch_channel_signing_data = MagicMock(side_effect=err)
+    assert sig_ver.trusted_root == initial_trust_root
+    sig_ver._fetch_channel_signing_data.assert_called_once()
+    assert (tmp_path / ".last_refresh").exists()
+
+    # Second instance within the TTL: no network traffic at all
+    sig_ver2 = _SignatureVerification()
+    sig_ver2._fetch_channel_signing_data = MagicMock(side_effect=err)
+    assert sig_ver2.trusted_root == initial_trust_root
+    sig_ver2._fetch_channel_signing_data.assert_not_called()
+
+
+def test_trusted_root_expired_ttl_refreshes_again(
+    initial_trust_root: str,
+    tmp_path: Path,
+    mocker: MockerFixture,
+):
+    """
+    Once the stamp ages past the TTL the refresh loop must run again.
+    """
+    mocker.patch(
+        "conda.base.context.Context.av_data_dir",
+        new_callable=PropertyMock,
+        return_value=tmp_path,
+    )
+    mocker.patch(
+        "conda.trust.signature_verification.INITIAL_TRUST_ROOT",
+        new=initial_trust_root,
+    )
+
+    # An expired stamp from a previous refresh
+    stamp = tmp_path / ".last_refresh"
+    stamp.touch()
+    os.utime(stamp, (0, 0))
+
+    # Mock out HTTP request
+    err = HTTPError()
+    err.response = SimpleNamespace()
+    err.response.status_code = 404
+
+    sig_ver = _SignatureVerification()
+    sig_ver._fetch_channel_signing_data = MagicMock(side_effect=err)
+    assert sig_ver.trusted_root == initial_trust_root
+    sig_ver._fetch_channel_signing_data.assert_called_once()
+
+
+def test_trusted_root_failed_refresh_does_not_stamp(
+    initial_trust_root: str,
+    tmp_path: Path,
+    mocker: MockerFixture,
+):
+    """
+    A refresh that fails with a real error must not record the stamp, so the
+    next invocation retries.
+    """
+    mocker.patch(
+        "conda.base.context.Context.av_data_dir",
+        new_callable=PropertyMock,
+        return_value=tmp_path,
+    )
+    mocker.patch(
+        "conda.trust.signature_verification.INITIAL_TRUST_ROOT",
+        new=initial_trust_root,
+    )
+
+    # Mock out HTTP request
+    err = HTTPError()
+    err.response = SimpleNamespace()
+    err.response.status_code = 500
+
+    sig_ver = _SignatureVerification()
+    sig_ver._fetch_channel_signing_data = MagicMock(side_effect=err)
+    assert sig_ver.trusted_root == initial_trust_root
+    assert not (tmp_path / ".last_refresh").exists()
+
+
 ######## Begin Keymgr Tests ########
 
 
@@ -375,7 +478,7 @@ def test_trusted_root_new_key_mgr_online(
 
     # First time around we return an HTTPError(404) to signal we don't have new root metadata.
     # Next, we return our new key_mgr data signaling we should update our key_mgr delegation
-    data_mock.side_effect = [test_key_mgr_data, err]
+    data_mock.side_effect = [(test_key_mgr_data, {}), err]
     sig_ver = _SignatureVerification()
     if not sig_ver.enabled:
         pytest.skip("Signature verification not enabled")
@@ -436,8 +539,47 @@ def test_trusted_root_invalid_key_mgr_online_valid_on_disk(
 
     # First time around we return an HTTPError(404) to signal we don't have new root metadata.
     # Next, we return our new key_mgr data signaling we should update our key_mgr delegation
-    data_mock.side_effect = [test_key_mgr_invalid_data, err]
+    data_mock.side_effect = [(test_key_mgr_invalid_data, {}), err]
     sig_ver._fetch_channel_signing_data = data_mock
 
     with pytest.raises(SignatureError):
         check_key_mgr = sig_ver.key_mgr
+
+
+def test_key_mgr_304_keeps_local_copy(
+    initial_trust_root: str,
+    tmp_path: Path,
+    mocker: MockerFixture,
+):
+    """
+    A 304 from the server (matching validators) means the on-disk key_mgr is
+    current; we keep it without fetching or re-verifying a body.
+    """
+    mocker.patch(
+        "conda.base.context.Context.av_data_dir",
+        new_callable=PropertyMock,
+        return_value=tmp_path,
+    )
+    mocker.patch(
+        "conda.trust.signature_verification.INITIAL_TRUST_ROOT",
+        new=initial_trust_root,
+    )
+
+    # Find key_mgr.json in our test data directory, copy it into our tmp
+    # trust root dir, and age it past the freshness TTL so the conditional
+    # fetch is actually attempted
+    test_key_mgr_path = _TESTDATA / "key_mgr.json"
+    test_key_mgr_dest = tmp_path / "key_mgr.json"
+    copyfile(test_key_mgr_path, test_key_mgr_dest)
+    os.utime(test_key_mgr_dest, (0, 0))
+
+    test_key_mgr_data = json.loads(test_key_mgr_path.read_text())
+
+    sig_ver = _SignatureVerification()
+
+    # The fetch helper signals HTTP 304 with an empty body
+    sig_ver._fetch_channel_signing_data = MagicMock(return_value=(None, {}))
+
+    check_key_mgr = sig_ver.key_mgr
+    sig_ver._fetch_channel_signing_data.assert_called_once()
+    assert check_key_mgr == test_key_mgr_data